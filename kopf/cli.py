@@ -1,6 +1,7 @@
 import asyncio
 import dataclasses
 import functools
+import threading
 from typing import Any, Optional, Callable, List
 
 import click
@@ -43,7 +44,36 @@ def logging_options(fn: Callable[..., Any]) -> Callable[..., Any]:
     auto_envvar_prefix='KOPF',
 ))
 def main() -> None:
-    pass
+    _set_uvloop_event_loop()
+
+
+def _set_uvloop_event_loop() -> None:
+    """
+    Use a uvloop's event loop for the CLI commands if uvloop is installed (optional).
+
+    The loop is created and set explicitly, the event loop policy is not changed:
+    uvloop's policy does not create the loops implicitly on ``get_event_loop()``,
+    while the CLI commands and the logging setup rely on that.
+
+    The previous loop of the main thread is closed, so that its resources
+    are not left open; a uvloop's loop set by a previous command is reused.
+
+    Only the real CLI process (the main thread) is switched. The embedded
+    and testing runs (e.g. `KopfRunner`) execute the CLI commands in threads
+    with their own pre-created loops, which must remain untouched.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        previous_loop = asyncio.get_event_loop()
+        if not isinstance(previous_loop, uvloop.Loop):
+            asyncio.set_event_loop(uvloop.new_event_loop())
+            previous_loop.close()
 
 
 @main.command()
@@ -1,7 +1,7 @@
-import copy
 import datetime
+import json
 import logging
-from typing import Optional
+from typing import Any, Mapping, Optional, cast
 
 import aiohttp
 
@@ -9,6 +9,11 @@ from kopf.clients import auth
 from kopf.structs import bodies
 from kopf.structs import resources
 
+try:
+    import orjson  # optional, faster
+except ImportError:
+    orjson = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 EVENTS_V1BETA1_CRD = resources.Resource('events.k8s.io', 'v1beta1', 'events')
@@ -17,6 +22,19 @@ EVENTS_CORE_V1_CRD = resources.Resource('', 'v1', 'events')
 MAX_MESSAGE_LENGTH = 1024
 CUT_MESSAGE_INFIX = '...'
 
+# The cut-points of too long messages, so that the infix is exactly in the middle.
+_CUT_PREFIX_LENGTH = MAX_MESSAGE_LENGTH // 2 - len(CUT_MESSAGE_INFIX) // 2
+_CUT_SUFFIX_START = -MAX_MESSAGE_LENGTH // 2 + (len(CUT_MESSAGE_INFIX) - len(CUT_MESSAGE_INFIX) // 2)
+
+# The constant fields of all events; the per-event fields are added on top of them.
+# It is never modified: the events' bodies are serialized and sent immediately.
+_EVENT_TEMPLATE: Mapping[str, Any] = {
+    'action': 'Action?',
+    'reportingComponent': 'kopf',
+    'reportingInstance': 'dev',
+    'source' : {'component': 'kopf'},  # used in the "From" column in `kubectl describe`.
+}
+
 
 @auth.reauthenticated_request
 async def post_event(
@@ -25,6 +43,7 @@ async def post_event(
         type: str,
         reason: str,
         message: str = '',
+        count: int = 1,
         context: Optional[auth.APIContext] = None,  # injected by the decorator
 ) -> None:
     """
@@ -40,50 +59,55 @@ async def post_event(
     # See #164. For cluster-scoped objects, use the current namespace from the current context.
     # It could be "default", but in some systems, we are limited to one specific namespace only.
     namespace: str = ref.get('namespace') or context.default_namespace or 'default'
-    full_ref: bodies.ObjectReference = copy.copy(ref)
-    full_ref['namespace'] = namespace
+    full_ref = cast(bodies.ObjectReference, {**ref, 'namespace': namespace})
 
     # Prevent a common case of event posting errors but shortening the message.
     if len(message) > MAX_MESSAGE_LENGTH:
-        infix = CUT_MESSAGE_INFIX
-        prefix = message[:MAX_MESSAGE_LENGTH // 2 - (len(infix) // 2)]
-        suffix = message[-MAX_MESSAGE_LENGTH // 2 + (len(infix) - len(infix) // 2):]
-        message = f'{prefix}{infix}{suffix}'
+        message = f'{message[:_CUT_PREFIX_LENGTH]}{CUT_MESSAGE_INFIX}{message[_CUT_SUFFIX_START:]}'
 
-    now = datetime.datetime.utcnow()
+    # A MicroTime, as required for eventTime: '2019-01-28T18:25:03.000000+00:00' -> '...000000Z'.
+    now = datetime.datetime.now(datetime.timezone.utc)
+    timestamp = now.isoformat(timespec='microseconds')[:-6] + 'Z'
     body = {
+        **_EVENT_TEMPLATE,
+
         'metadata': {
             'namespace': namespace,
             'generateName': 'kopf-event-',
         },
 
-        'action': 'Action?',
         'type': type,
         'reason': reason,
         'message': message,
 
-        'reportingComponent': 'kopf',
-        'reportingInstance': 'dev',
-        'source' : {'component': 'kopf'},  # used in the "From" column in `kubectl describe`.
-
         'involvedObject': full_ref,
+        'count': count,  # for the identical events aggregated into one
 
-        'firstTimestamp': now.isoformat() + 'Z',  # '2019-01-28T18:25:03.000000Z' -- seen in `kubectl describe ...`
-        'lastTimestamp': now.isoformat() + 'Z',  # '2019-01-28T18:25:03.000000Z' - seen in `kubectl get events`
-        'eventTime': now.isoformat() + 'Z',  # '2019-01-28T18:25:03.000000Z'
+        'firstTimestamp': timestamp,  # seen in `kubectl describe ...`
+        'lastTimestamp': timestamp,  # seen in `kubectl get events`
+        'eventTime': timestamp,
     }
 
     try:
         response = await context.session.post(
             url=EVENTS_CORE_V1_CRD.get_url(server=context.server, namespace=namespace),
             headers={'Content-Type': 'application/json'},
-            json=body,
+            data=_serialize(body),
         )
         response.raise_for_status()
 
     except aiohttp.ClientResponseError as e:
         # Events are helpful but auxiliary, they should not fail the handling cycle.
         # Yet we want to notice that something went wrong (in logs).
-        logger.warning(f"Failed to post an event. Ignoring and continuing. "
-                       f"Status: {e.status}. Message: {e.message}. "
-                       f"Event: type={type!r}, reason={reason!r}, message={message!r}.")
+        logger.warning("Failed to post an event. Ignoring and continuing. "
+                       "Status: %s. Message: %s. "
+                       "Event: type=%r, reason=%r, message=%r.",
+                       e.status, e.message, type, reason, message)
+
+
+def _serialize(body: Any) -> bytes:
+    """ Serialize the body to JSON with orjson if it is installed, or with stdlib's json. """
+    if orjson is not None:
+        return orjson.dumps(body)
+    else:
+        return json.dumps(body).encode('utf-8')
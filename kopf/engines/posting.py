@@ -18,13 +18,16 @@ import asyncio
 import logging
 import sys
 from contextvars import ContextVar
-from typing import NamedTuple, NoReturn, Optional, Union, Iterator, Iterable, cast, TYPE_CHECKING
+from typing import (NamedTuple, NoReturn, Optional, Union, Iterator, Iterable, Dict, Hashable,
+                    Tuple, cast, TYPE_CHECKING)
 
 from kopf.clients import events
 from kopf.structs import bodies
 from kopf.structs import configuration
 from kopf.structs import dicts
 
+logger = logging.getLogger(__name__)
+
 if TYPE_CHECKING:
     K8sEventQueue = asyncio.Queue["K8sEvent"]
 else:
@@ -76,12 +79,35 @@ def enqueue(
         # Posting from the same event-loop as the poster task and queue are in.
         # Therefore, it is the same thread, and all calls here are thread-safe.
         # Special thread-safe cross-event-loop methods make no effect here.
-        queue.put_nowait(event)
+        _put_or_drop(queue, event)
     else:
         # No event-loop or another event-loop - assume another thread.
-        # Use the cross-thread thread-safe methods. Block until enqueued there.
-        future = asyncio.run_coroutine_threadsafe(queue.put(event), loop=loop)
-        future.result()  # block, wait, re-raise.
+        # Use the cross-thread thread-safe methods. Do not wait for the result:
+        # with a full queue, the event is dropped anyway, so there is nothing to wait for.
+        loop.call_soon_threadsafe(_put_or_drop, queue, event)
+
+
+def _put_or_drop(
+        queue: K8sEventQueue,
+        event: K8sEvent,
+) -> None:
+    """
+    Queue a k8s-event, or drop it if the queue is full (e.g. the API is slow).
+
+    K8s-events are auxiliary: it is better to lose some of them than to block
+    the handlers and the whole operator until the API is responsive again.
+
+    The limit is checked here rather than by the queue itself, so that it can
+    be changed at any time, e.g. in the startup handlers (the queue is created
+    before them).
+    """
+    settings: configuration.OperatorSettings = settings_var.get()
+    if 0 < settings.posting.queue_size <= queue.qsize():
+        logger.warning("K8s-event is dropped: the posting queue is full. "
+                       "Event: type=%r, reason=%r, message=%r.",
+                       event.type, event.reason, event.message)
+    else:
+        queue.put_nowait(event)
 
 
 def event(
@@ -155,15 +181,43 @@ async def poster(
     they have these special fields defined already.
 
     In either case, we pass the queued events directly to the K8s client
-    (or a client wrapper/adapter), with no extra processing.
+    (or a client wrapper/adapter), with no extra processing -- except for
+    the aggregation of the identical events that are already in the queue.
 
     This task is defined in this module only because all other tasks are here,
     so we keep all forever-running tasks together.
     """
     while True:
-        posted_event = await event_queue.get()
-        await events.post_event(
-            ref=posted_event.ref,
-            type=posted_event.type,
-            reason=posted_event.reason,
-            message=posted_event.message)
+        posted_events = [await event_queue.get()]
+        while not event_queue.empty():
+            posted_events.append(event_queue.get_nowait())
+
+        for posted_event, count in _aggregated(posted_events):
+            await events.post_event(
+                ref=posted_event.ref,
+                type=posted_event.type,
+                reason=posted_event.reason,
+                message=posted_event.message,
+                count=count)
+
+
+def _aggregated(
+        k8s_events: Iterable[K8sEvent],
+) -> Iterator[Tuple[K8sEvent, int]]:
+    """
+    Aggregate the identical k8s-events into one, with the number of repeats.
+
+    This is the same aggregation as done by Kubernetes itself (and its clients):
+    the events with the same involved object, type, reason, and message
+    are posted once with their ``count`` -- instead of one API call per event.
+
+    Only the events that are already queued are aggregated: we do not wait
+    for the new events to come, so the posting is not delayed in any way.
+    The order is preserved by the first occurrence of each event.
+    """
+    counts: Dict[Hashable, Tuple[K8sEvent, int]] = {}
+    for k8s_event in k8s_events:
+        key = (frozenset(k8s_event.ref.items()), k8s_event.type, k8s_event.reason, k8s_event.message)
+        first_event, count = counts.get(key, (k8s_event, 0))
+        counts[key] = (first_event, count + 1)
+    yield from counts.values()
@@ -30,6 +30,9 @@ ResourceChangingDecorator = Callable[[callbacks.ResourceChangingFn], callbacks.R
 ResourceDaemonDecorator = Callable[[callbacks.ResourceDaemonFn], callbacks.ResourceDaemonFn]
 ResourceTimerDecorator = Callable[[callbacks.ResourceTimerFn], callbacks.ResourceTimerFn]
 
+# Resolved once: the decorators are applied many times on the operator's import.
+_get_default_registry = registries.get_default_registry
+
 
 def startup(  # lgtm[py/similar-function]
         *,
@@ -43,7 +46,7 @@ def startup(  # lgtm[py/similar-function]
 ) -> ActivityDecorator:
     def decorator(fn: callbacks.ActivityFn) -> callbacks.ActivityFn:
         _warn_deprecated_signatures(fn)
-        real_registry = registry if registry is not None else registries.get_default_registry()
+        real_registry = registry if registry is not None else _get_default_registry()
         real_id = registries.generate_id(fn=fn, id=id)
         handler = handlers.ActivityHandler(
             fn=fn, id=real_id,
@@ -67,7 +70,7 @@ def cleanup(  # lgtm[py/similar-function]
 ) -> ActivityDecorator:
     def decorator(fn: callbacks.ActivityFn) -> callbacks.ActivityFn:
         _warn_deprecated_signatures(fn)
-        real_registry = registry if registry is not None else registries.get_default_registry()
+        real_registry = registry if registry is not None else _get_default_registry()
         real_id = registries.generate_id(fn=fn, id=id)
         handler = handlers.ActivityHandler(
             fn=fn, id=real_id,
@@ -92,7 +95,7 @@ def login(  # lgtm[py/similar-function]
     """ ``@kopf.on.login()`` handler for custom (re-)authentication. """
     def decorator(fn: callbacks.ActivityFn) -> callbacks.ActivityFn:
         _warn_deprecated_signatures(fn)
-        real_registry = registry if registry is not None else registries.get_default_registry()
+        real_registry = registry if registry is not None else _get_default_registry()
         real_id = registries.generate_id(fn=fn, id=id)
         handler = handlers.ActivityHandler(
             fn=fn, id=real_id,
@@ -117,7 +120,7 @@ def probe(  # lgtm[py/similar-function]
     """ ``@kopf.on.probe()`` handler for arbitrary liveness metrics. """
     def decorator(fn: callbacks.ActivityFn) -> callbacks.ActivityFn:
         _warn_deprecated_signatures(fn)
-        real_registry = registry if registry is not None else registries.get_default_registry()
+        real_registry = registry if registry is not None else _get_default_registry()
         real_id = registries.generate_id(fn=fn, id=id)
         handler = handlers.ActivityHandler(
             fn=fn, id=real_id,
@@ -145,22 +148,14 @@ def resume(  # lgtm[py/similar-function]
         when: Optional[callbacks.WhenFilterFn] = None,
 ) -> ResourceChangingDecorator:
     """ ``@kopf.on.resume()`` handler for the object resuming on operator (re)start. """
-    def decorator(fn: callbacks.ResourceChangingFn) -> callbacks.ResourceChangingFn:
-        _warn_deprecated_signatures(fn)
-        _warn_deprecated_filters(labels, annotations)
-        real_registry = registry if registry is not None else registries.get_default_registry()
-        real_resource = resources.Resource(group, version, plural)
-        real_id = registries.generate_id(fn=fn, id=id)
-        handler = handlers.ResourceChangingHandler(
-            fn=fn, id=real_id, field=None,
-            errors=errors, timeout=timeout, retries=retries, backoff=backoff, cooldown=cooldown,
-            labels=labels, annotations=annotations, when=when,
-            initial=True, deleted=deleted, requires_finalizer=None,
-            reason=None,
-        )
-        real_registry.resource_changing_handlers[real_resource].append(handler)
-        return fn
-    return decorator
+    return _resource_changing_decorator(
+        group=group, version=version, plural=plural, field=None,
+        id=id, registry=registry,
+        errors=errors, timeout=timeout, retries=retries, backoff=backoff, cooldown=cooldown,
+        labels=labels, annotations=annotations, when=when,
+        initial=True, deleted=deleted, requires_finalizer=None,
+        reason=None,
+    )
 
 
 def create(  # lgtm[py/similar-function]
@@ -178,22 +173,14 @@ def create(  # lgtm[py/similar-function]
         when: Optional[callbacks.WhenFilterFn] = None,
 ) -> ResourceChangingDecorator:
     """ ``@kopf.on.create()`` handler for the object creation. """
-    def decorator(fn: callbacks.ResourceChangingFn) -> callbacks.ResourceChangingFn:
-        _warn_deprecated_signatures(fn)
-        _warn_deprecated_filters(labels, annotations)
-        real_registry = registry if registry is not None else registries.get_default_registry()
-        real_resource = resources.Resource(group, version, plural)
-        real_id = registries.generate_id(fn=fn, id=id)
-        handler = handlers.ResourceChangingHandler(
-            fn=fn, id=real_id, field=None,
-            errors=errors, timeout=timeout, retries=retries, backoff=backoff, cooldown=cooldown,
-            labels=labels, annotations=annotations, when=when,
-            initial=None, deleted=None, requires_finalizer=None,
-            reason=handlers.Reason.CREATE,
-        )
-        real_registry.resource_changing_handlers[real_resource].append(handler)
-        return fn
-    return decorator
+    return _resource_changing_decorator(
+        group=group, version=version, plural=plural, field=None,
+        id=id, registry=registry,
+        errors=errors, timeout=timeout, retries=retries, backoff=backoff, cooldown=cooldown,
+        labels=labels, annotations=annotations, when=when,
+        initial=None, deleted=None, requires_finalizer=None,
+        reason=handlers.Reason.CREATE,
+    )
 
 
 def update(  # lgtm[py/similar-function]
@@ -211,22 +198,14 @@ def update(  # lgtm[py/similar-function]
         when: Optional[callbacks.WhenFilterFn] = None,
 ) -> ResourceChangingDecorator:
     """ ``@kopf.on.update()`` handler for the object update or change. """
-    def decorator(fn: callbacks.ResourceChangingFn) -> callbacks.ResourceChangingFn:
-        _warn_deprecated_signatures(fn)
-        _warn_deprecated_filters(labels, annotations)
-        real_registry = registry if registry is not None else registries.get_default_registry()
-        real_resource = resources.Resource(group, version, plural)
-        real_id = registries.generate_id(fn=fn, id=id)
-        handler = handlers.ResourceChangingHandler(
-            fn=fn, id=real_id, field=None,
-            errors=errors, timeout=timeout, retries=retries, backoff=backoff, cooldown=cooldown,
-            labels=labels, annotations=annotations, when=when,
-            initial=None, deleted=None, requires_finalizer=None,
-            reason=handlers.Reason.UPDATE,
-        )
-        real_registry.resource_changing_handlers[real_resource].append(handler)
-        return fn
-    return decorator
+    return _resource_changing_decorator(
+        group=group, version=version, plural=plural, field=None,
+        id=id, registry=registry,
+        errors=errors, timeout=timeout, retries=retries, backoff=backoff, cooldown=cooldown,
+        labels=labels, annotations=annotations, when=when,
+        initial=None, deleted=None, requires_finalizer=None,
+        reason=handlers.Reason.UPDATE,
+    )
 
 
 def delete(  # lgtm[py/similar-function]
@@ -245,22 +224,14 @@ def delete(  # lgtm[py/similar-function]
         when: Optional[callbacks.WhenFilterFn] = None,
 ) -> ResourceChangingDecorator:
     """ ``@kopf.on.delete()`` handler for the object deletion. """
-    def decorator(fn: callbacks.ResourceChangingFn) -> callbacks.ResourceChangingFn:
-        _warn_deprecated_signatures(fn)
-        _warn_deprecated_filters(labels, annotations)
-        real_registry = registry if registry is not None else registries.get_default_registry()
-        real_resource = resources.Resource(group, version, plural)
-        real_id = registries.generate_id(fn=fn, id=id)
-        handler = handlers.ResourceChangingHandler(
-            fn=fn, id=real_id, field=None,
-            errors=errors, timeout=timeout, retries=retries, backoff=backoff, cooldown=cooldown,
-            labels=labels, annotations=annotations, when=when,
-            initial=None, deleted=None, requires_finalizer=bool(not optional),
-            reason=handlers.Reason.DELETE,
-        )
-        real_registry.resource_changing_handlers[real_resource].append(handler)
-        return fn
-    return decorator
+    return _resource_changing_decorator(
+        group=group, version=version, plural=plural, field=None,
+        id=id, registry=registry,
+        errors=errors, timeout=timeout, retries=retries, backoff=backoff, cooldown=cooldown,
+        labels=labels, annotations=annotations, when=when,
+        initial=None, deleted=None, requires_finalizer=bool(not optional),
+        reason=handlers.Reason.DELETE,
+    )
 
 
 def field(  # lgtm[py/similar-function]
@@ -279,23 +250,14 @@ def field(  # lgtm[py/similar-function]
         when: Optional[callbacks.WhenFilterFn] = None,
 ) -> ResourceChangingDecorator:
     """ ``@kopf.on.field()`` handler for the individual field changes. """
-    def decorator(fn: callbacks.ResourceChangingFn) -> callbacks.ResourceChangingFn:
-        _warn_deprecated_signatures(fn)
-        _warn_deprecated_filters(labels, annotations)
-        real_registry = registry if registry is not None else registries.get_default_registry()
-        real_resource = resources.Resource(group, version, plural)
-        real_field = dicts.parse_field(field) or None  # to not store tuple() as a no-field case.
-        real_id = registries.generate_id(fn=fn, id=id, suffix=".".join(real_field or []))
-        handler = handlers.ResourceChangingHandler(
-            fn=fn, id=real_id, field=real_field,
-            errors=errors, timeout=timeout, retries=retries, backoff=backoff, cooldown=cooldown,
-            labels=labels, annotations=annotations, when=when,
-            initial=None, deleted=None, requires_finalizer=None,
-            reason=None,
-        )
-        real_registry.resource_changing_handlers[real_resource].append(handler)
-        return fn
-    return decorator
+    return _resource_changing_decorator(
+        group=group, version=version, plural=plural, field=field,
+        id=id, registry=registry,
+        errors=errors, timeout=timeout, retries=retries, backoff=backoff, cooldown=cooldown,
+        labels=labels, annotations=annotations, when=when,
+        initial=None, deleted=None, requires_finalizer=None,
+        reason=None,
+    )
 
 
 def event(  # lgtm[py/similar-function]
@@ -311,7 +273,7 @@ def event(  # lgtm[py/similar-function]
     def decorator(fn: callbacks.ResourceWatchingFn) -> callbacks.ResourceWatchingFn:
         _warn_deprecated_signatures(fn)
         _warn_deprecated_filters(labels, annotations)
-        real_registry = registry if registry is not None else registries.get_default_registry()
+        real_registry = registry if registry is not None else _get_default_registry()
         real_resource = resources.Resource(group, version, plural)
         real_id = registries.generate_id(fn=fn, id=id)
         handler = handlers.ResourceWatchingHandler(
@@ -346,7 +308,7 @@ def daemon(  # lgtm[py/similar-function]
     def decorator(fn: callbacks.ResourceDaemonFn) -> callbacks.ResourceDaemonFn:
         _warn_deprecated_signatures(fn)
         _warn_deprecated_filters(labels, annotations)
-        real_registry = registry if registry is not None else registries.get_default_registry()
+        real_registry = registry if registry is not None else _get_default_registry()
         real_resource = resources.Resource(group, version, plural)
         real_id = registries.generate_id(fn=fn, id=id)
         handler = handlers.ResourceDaemonHandler(
@@ -385,7 +347,7 @@ def timer(  # lgtm[py/similar-function]
     def decorator(fn: callbacks.ResourceTimerFn) -> callbacks.ResourceTimerFn:
         _warn_deprecated_signatures(fn)
         _warn_deprecated_filters(labels, annotations)
-        real_registry = registry if registry is not None else registries.get_default_registry()
+        real_registry = registry if registry is not None else _get_default_registry()
         real_resource = resources.Resource(group, version, plural)
         real_id = registries.generate_id(fn=fn, id=id)
         handler = handlers.ResourceTimerHandler(
@@ -509,6 +471,47 @@ def register(  # lgtm[py/similar-function]
     return decorator(fn)
 
 
+def _resource_changing_decorator(
+        *,
+        group: str,
+        version: str,
+        plural: str,
+        field: Optional[dicts.FieldSpec],
+        id: Optional[str],
+        errors: Optional[handlers.ErrorsMode],
+        timeout: Optional[float],
+        retries: Optional[int],
+        backoff: Optional[float],
+        cooldown: Optional[float],  # deprecated, use `backoff`
+        registry: Optional[registries.OperatorRegistry],
+        labels: Optional[filters.MetaFilter],
+        annotations: Optional[filters.MetaFilter],
+        when: Optional[callbacks.WhenFilterFn],
+        initial: Optional[bool],
+        deleted: Optional[bool],
+        requires_finalizer: Optional[bool],
+        reason: Optional[handlers.Reason],
+) -> ResourceChangingDecorator:
+    """ A shared implementation of all resource-changing decorators. """
+    def decorator(fn: callbacks.ResourceChangingFn) -> callbacks.ResourceChangingFn:
+        _warn_deprecated_signatures(fn)
+        _warn_deprecated_filters(labels, annotations)
+        real_registry = registry if registry is not None else _get_default_registry()
+        real_resource = resources.Resource(group, version, plural)
+        real_field = dicts.parse_field(field) or None  # to not store tuple() as a no-field case.
+        real_id = registries.generate_id(fn=fn, id=id, suffix=".".join(real_field or []))
+        handler = handlers.ResourceChangingHandler(
+            fn=fn, id=real_id, field=real_field,
+            errors=errors, timeout=timeout, retries=retries, backoff=backoff, cooldown=cooldown,
+            labels=labels, annotations=annotations, when=when,
+            initial=initial, deleted=deleted, requires_finalizer=requires_finalizer,
+            reason=reason,
+        )
+        real_registry.resource_changing_handlers[real_resource].append(handler)
+        return fn
+    return decorator
+
+
 def _warn_deprecated_signatures(
         fn: Callable[..., Any],
 ) -> None:
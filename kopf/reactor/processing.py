@@ -83,8 +83,12 @@ async def process_resource_event(
     logger = logging_engine.ObjectLogger(body=body, settings=settings)
     posting.event_queue_loop_var.set(asyncio.get_running_loop())
     posting.event_queue_var.set(event_queue)  # till the end of this object's task.
+    posting.settings_var.set(settings)  # for the queue's limit, which can change at runtime.
 
-    extra_fields = registry.resource_changing_handlers[resource].get_extra_fields()
+    watching_registry, spawning_registry, changing_registry = \
+        registry.get_resource_registries(resource)
+
+    extra_fields = changing_registry.get_extra_fields()
     old = settings.persistence.diffbase_storage.fetch(body=body)
     new = settings.persistence.diffbase_storage.build(body=body, extra_fields=extra_fields)
     old = settings.persistence.progress_storage.clear(essence=old) if old is not None else None
@@ -99,7 +103,7 @@ async def process_resource_event(
         patch=patch,
         body=body,
         memo=memory.memo,
-    ) if registry.resource_watching_handlers[resource] else None
+    ) if watching_registry else None
 
     resource_spawning_cause = causation.detect_resource_spawning_cause(
         resource=resource,
@@ -108,7 +112,7 @@ async def process_resource_event(
         body=body,
         memo=memory.memo,
         reset=bool(diff),  # only essential changes reset idling, not every event
-    ) if registry.resource_spawning_handlers[resource] else None
+    ) if spawning_registry else None
 
     resource_changing_cause = causation.detect_resource_changing_cause(
         finalizer=finalizer,
@@ -122,7 +126,7 @@ async def process_resource_event(
         diff=diff,
         memo=memory.memo,
         initial=memory.noticed_by_listing and not memory.fully_handled_once,
-    ) if registry.resource_changing_handlers[resource] else None
+    ) if changing_registry else None
 
     # Block the object from deletion if we have anything to do in its end of life:
     # specifically, if there are daemons to kill or mandatory on-deletion handlers to call.
@@ -132,13 +136,13 @@ async def process_resource_event(
     deletion_is_blocked = finalizers.is_deletion_blocked(body=body, finalizer=finalizer)
     deletion_must_be_blocked = (
         (resource_spawning_cause is not None and
-         registry.resource_spawning_handlers[resource].requires_finalizer(
+         spawning_registry.requires_finalizer(
              cause=resource_spawning_cause,
              excluded=memory.forever_stopped,
          ))
         or
         (resource_changing_cause is not None and
-         registry.resource_changing_handlers[resource].requires_finalizer(
+         changing_registry.requires_finalizer(
              cause=resource_changing_cause,
          )))
 
@@ -158,7 +162,7 @@ async def process_resource_event(
     if resource_watching_cause is not None:
         await process_resource_watching_cause(
             lifecycle=lifecycles.all_at_once,
-            registry=registry,
+            registry=watching_registry,
             settings=settings,
             cause=resource_watching_cause,
         )
@@ -166,7 +170,7 @@ async def process_resource_event(
     resource_spawning_delays: Collection[float] = []
     if resource_spawning_cause is not None:
         resource_spawning_delays = await process_resource_spawning_cause(
-            registry=registry,
+            registry=spawning_registry,
             settings=settings,
             memory=memory,
             cause=resource_spawning_cause,
@@ -176,7 +180,7 @@ async def process_resource_event(
     if resource_changing_cause is not None:
         resource_changing_delays = await process_resource_changing_cause(
             lifecycle=lifecycle,
-            registry=registry,
+            registry=changing_registry,
             settings=settings,
             memory=memory,
             cause=resource_changing_cause,
@@ -261,7 +265,7 @@ async def apply_reaction_outcomes(
 
 async def process_resource_watching_cause(
         lifecycle: lifecycles.LifeCycleFn,
-        registry: registries.OperatorRegistry,
+        registry: registries.ResourceWatchingRegistry,
         settings: configuration.OperatorSettings,
         cause: causation.ResourceWatchingCause,
 ) -> None:
@@ -275,7 +279,7 @@ async def process_resource_watching_cause(
     Note: K8s-event posting is skipped for `kopf.on.event` handlers,
     as they should be silent. Still, the messages are logged normally.
     """
-    handlers = registry.resource_watching_handlers[cause.resource].get_handlers(cause=cause)
+    handlers = registry.get_handlers(cause=cause)
     outcomes = await handling.execute_handlers_once(
         lifecycle=lifecycle,
         settings=settings,
@@ -290,7 +294,7 @@ async def process_resource_watching_cause(
 
 
 async def process_resource_spawning_cause(
-        registry: registries.OperatorRegistry,
+        registry: registries.ResourceSpawningRegistry,
         settings: configuration.OperatorSettings,
         memory: containers.ResourceMemory,
         cause: causation.ResourceSpawningCause,
@@ -323,7 +327,7 @@ async def process_resource_spawning_cause(
         return stopping_delays
 
     else:
-        handlers = registry.resource_spawning_handlers[cause.resource].get_handlers(
+        handlers = registry.get_handlers(
             cause=cause,
             excluded=memory.forever_stopped,
         )
@@ -344,7 +348,7 @@ async def process_resource_spawning_cause(
 
 async def process_resource_changing_cause(
         lifecycle: lifecycles.LifeCycleFn,
-        registry: registries.OperatorRegistry,
+        registry: registries.ResourceChangingRegistry,
         settings: configuration.OperatorSettings,
         memory: containers.ResourceMemory,
         cause: causation.ResourceChangingCause,
@@ -366,7 +370,7 @@ async def process_resource_changing_cause(
         if cause.diff and cause.old is not None and cause.new is not None:
             logger.debug(f"{title.capitalize()} diff: %r", cause.diff)
 
-        handlers = registry.resource_changing_handlers[cause.resource].get_handlers(cause=cause)
+        handlers = registry.get_handlers(cause=cause)
         storage = settings.persistence.progress_storage
         state = states.State.from_storage(body=cause.body, storage=storage, handlers=handlers)
         if handlers:
@@ -14,11 +14,13 @@ of the handlers to be executed on each reaction cycle.
 import abc
 import collections
 import functools
+import importlib.util
+import sys
 import warnings
-from types import FunctionType, MethodType
+from types import FunctionType, MethodType, MappingProxyType
 from typing import (Any, MutableMapping, Optional, Sequence, Collection, Iterable, Iterator,
                     List, Set, FrozenSet, Mapping, Callable, cast, Generic, TypeVar, Union,
-                    Container)
+                    Dict, Tuple, AbstractSet)
 
 from kopf.reactor import causation
 from kopf.reactor import invocation
@@ -40,14 +42,27 @@ HandlerFnT = TypeVar('HandlerFnT',
                      callbacks.ResourceChangingFn,
                      Union[callbacks.ResourceWatchingFn, callbacks.ResourceChangingFn])  # DEPRECATED: for legacy_registries
 
+# The optional client libraries are detected once, and without importing them (they are heavy).
+# The fallback login handlers import them anyway, and are ready if their import fails.
+_HAS_PYKUBE = importlib.util.find_spec('pykube') is not None
+_HAS_KUBERNETES = importlib.util.find_spec('kubernetes') is not None
+
+# Read-only fallbacks for the absent values, to not create new empty containers on every check.
+_EMPTY_MAPPING: Mapping[str, Any] = MappingProxyType({})
+_EMPTY_FIELDS: FrozenSet[dicts.FieldPath] = frozenset()
+
 
 class GenericRegistry(Generic[HandlerFnT, HandlerT]):
     """ A generic base class of a simple registry (with no handler getters). """
     _handlers: List[HandlerT]
+    _handler_fn_ids: Set[int]
+    _has_repeated_fns: bool
 
     def __init__(self) -> None:
         super().__init__()
         self._handlers = []
+        self._handler_fn_ids = set()
+        self._has_repeated_fns = False
 
     def __bool__(self) -> bool:
         return bool(self._handlers)
@@ -55,6 +70,20 @@ class GenericRegistry(Generic[HandlerFnT, HandlerT]):
     def append(self, handler: HandlerT) -> None:
         self._handlers.append(handler)
 
+        # Remember if the same function is registered more than once (e.g. with multiple decorators).
+        # If not (usually), there is nothing to deduplicate when the handlers are retrieved.
+        self._has_repeated_fns = self._has_repeated_fns or id(handler.fn) in self._handler_fn_ids
+        self._handler_fn_ids.add(id(handler.fn))
+
+    def _unique_list(self, handlers: Iterable[HandlerT]) -> List[HandlerT]:
+        if self._has_repeated_fns:
+            # The first-seen handler of each function is kept, and the order is preserved.
+            first_seen: Dict[int, HandlerT] = {}
+            return [handler for handler in handlers
+                    if first_seen.setdefault(id(handler.fn), handler) is handler]
+        else:
+            return list(handlers)
+
 
 class ActivityRegistry(GenericRegistry[
         callbacks.ActivityFn,
@@ -89,7 +118,7 @@ class ActivityRegistry(GenericRegistry[
             self,
             activity: handlers.Activity,
     ) -> Sequence[handlers.ActivityHandler]:
-        return list(_deduplicated(self.iter_handlers(activity=activity)))
+        return self._unique_list(self.iter_handlers(activity=activity))
 
     def iter_handlers(
             self,
@@ -113,19 +142,28 @@ class ActivityRegistry(GenericRegistry[
 class ResourceRegistry(
         Generic[CauseT, HandlerFnT, ResourceHandlerT],
         GenericRegistry[HandlerFnT, ResourceHandlerT]):
+    _finalizer_handlers: Optional[List[ResourceHandlerT]]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._finalizer_handlers = None
+
+    def append(self, handler: ResourceHandlerT) -> None:
+        super().append(handler)
+        self._finalizer_handlers = None  # re-calculated on the next use.
 
     def get_handlers(
             self,
             cause: CauseT,
-            excluded: Container[handlers.HandlerId] = frozenset(),
+            excluded: AbstractSet[handlers.HandlerId] = frozenset(),
     ) -> Sequence[ResourceHandlerT]:
-        return list(_deduplicated(self.iter_handlers(cause=cause, excluded=excluded)))
+        return self._unique_list(self.iter_handlers(cause=cause, excluded=_as_set(excluded)))
 
     @abc.abstractmethod
     def iter_handlers(
             self,
             cause: CauseT,
-            excluded: Container[handlers.HandlerId] = frozenset(),
+            excluded: AbstractSet[handlers.HandlerId] = frozenset(),
     ) -> Iterator[ResourceHandlerT]:
         raise NotImplementedError
 
@@ -144,15 +182,24 @@ class ResourceRegistry(
     def requires_finalizer(
             self,
             cause: causation.ResourceCause,
-            excluded: Container[handlers.HandlerId] = frozenset(),
+            excluded: AbstractSet[handlers.HandlerId] = frozenset(),
     ) -> bool:
         """
         Check whether a finalizer should be added to the given resource or not.
         """
+        # Only few handlers usually require the finalizers, so they are filtered once in advance.
+        if self._finalizer_handlers is None:
+            self._finalizer_handlers = [handler for handler in self._handlers
+                                        if handler.requires_finalizer]
+
         # check whether the body matches a deletion handler
-        for handler in self._handlers:
+        excluded = _as_set(excluded)
+        labels, annotations = _get_labels_and_annotations(cause)
+        kwargs: MutableMapping[str, Any] = {}  # built on the first use, shared by all handlers.
+        for handler in self._finalizer_handlers:
             if handler.id not in excluded:
-                if handler.requires_finalizer and match(handler=handler, cause=cause):
+                if match(handler=handler, cause=cause,
+                         labels=labels, annotations=annotations, kwargs=kwargs):
                     return True
         return False
 
@@ -192,11 +239,15 @@ class ResourceWatchingRegistry(ResourceRegistry[
     def iter_handlers(
             self,
             cause: causation.ResourceWatchingCause,
-            excluded: Container[handlers.HandlerId] = frozenset(),
+            excluded: AbstractSet[handlers.HandlerId] = frozenset(),
     ) -> Iterator[handlers.ResourceWatchingHandler]:
+        excluded = _as_set(excluded)
+        labels, annotations = _get_labels_and_annotations(cause)
+        kwargs: MutableMapping[str, Any] = {}  # built on the first use, shared by all handlers.
         for handler in self._handlers:
             if handler.id not in excluded:
-                if match(handler=handler, cause=cause, ignore_fields=True):
+                if match(handler=handler, cause=cause, ignore_fields=True,
+                         labels=labels, annotations=annotations, kwargs=kwargs):
                     yield handler
 
 
@@ -209,11 +260,15 @@ class ResourceSpawningRegistry(ResourceRegistry[
     def iter_handlers(
             self,
             cause: causation.ResourceSpawningCause,
-            excluded: Container[handlers.HandlerId] = frozenset(),
+            excluded: AbstractSet[handlers.HandlerId] = frozenset(),
     ) -> Iterator[handlers.ResourceSpawningHandler]:
+        excluded = _as_set(excluded)
+        labels, annotations = _get_labels_and_annotations(cause)
+        kwargs: MutableMapping[str, Any] = {}  # built on the first use, shared by all handlers.
         for handler in self._handlers:
             if handler.id not in excluded:
-                if match(handler=handler, cause=cause):
+                if match(handler=handler, cause=cause,
+                         labels=labels, annotations=annotations, kwargs=kwargs):
                     yield handler
 
 
@@ -221,6 +276,18 @@ class ResourceChangingRegistry(ResourceRegistry[
         causation.ResourceChangingCause,
         callbacks.ResourceChangingFn,
         handlers.ResourceChangingHandler]):
+    _candidates: Dict[Tuple[handlers.Reason, bool, bool], List[handlers.ResourceChangingHandler]]
+    _fields_by_prefix: Optional[Mapping[dicts.FieldPath, FrozenSet[dicts.FieldPath]]]
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._candidates = {}
+        self._fields_by_prefix = None
+
+    def append(self, handler: handlers.ResourceChangingHandler) -> None:
+        super().append(handler)
+        self._candidates.clear()  # re-calculated on the next use.
+        self._fields_by_prefix = None  # re-calculated on the next use.
 
     def register(
             self,
@@ -264,19 +331,83 @@ class ResourceChangingRegistry(ResourceRegistry[
     def iter_handlers(
             self,
             cause: causation.ResourceChangingCause,
-            excluded: Container[handlers.HandlerId] = frozenset(),
+            excluded: AbstractSet[handlers.HandlerId] = frozenset(),
     ) -> Iterator[handlers.ResourceChangingHandler]:
-        changed_fields = frozenset(field for _, field, _, _ in cause.diff or [])
-        for handler in self._handlers:
+        excluded = _as_set(excluded)
+        changed_fields = frozenset(field for _, field, _, _ in cause.diff or ())
+        relevant_fields = self._get_relevant_fields(changed_fields)
+        labels, annotations = _get_labels_and_annotations(cause)
+        kwargs: MutableMapping[str, Any] = {}  # built on the first use, shared by all handlers.
+        candidates = self._get_candidates(reason=cause.reason,
+                                          initial=cause.initial,
+                                          deleted=cause.deleted)
+        for handler in candidates:
             if handler.id not in excluded:
-                if handler.reason is None or handler.reason == cause.reason:
-                    if handler.initial and not cause.initial:
-                        pass  # skip initial handlers in non-initial causes.
-                    elif handler.initial and cause.deleted and not handler.deleted:
-                        pass  # skip initial handlers on deletion, unless explicitly marked as used.
-                    elif match(handler=handler, cause=cause, changed_fields=changed_fields):
+                if not handler.field or handler.field in relevant_fields:
+                    if match(handler=handler, cause=cause, ignore_fields=True,
+                             labels=labels, annotations=annotations, kwargs=kwargs):
                         yield handler
 
+    def _get_candidates(
+            self,
+            reason: handlers.Reason,
+            initial: bool,
+            deleted: bool,
+    ) -> Sequence[handlers.ResourceChangingHandler]:
+        """
+        Get the handlers that fit the cause's reason & flags, ignoring the filters.
+
+        These criteria depend only on the handlers' declarations, so the lists
+        are calculated once per combination of the criteria, and then cached
+        until new handlers are added. The order of registration is preserved.
+        """
+        key = (reason, initial, deleted)
+        if key not in self._candidates:
+            # Skip initial handlers in non-initial causes.
+            # Skip initial handlers on deletion, unless explicitly marked as used.
+            self._candidates[key] = [
+                handler for handler in self._handlers
+                if handler.reason is None or handler.reason == reason
+                if not (handler.initial and not initial)
+                if not (handler.initial and deleted and not handler.deleted)
+            ]
+        return self._candidates[key]
+
+    def _get_relevant_fields(
+            self,
+            changed_fields: Collection[dicts.FieldPath],
+    ) -> Collection[dicts.FieldPath]:
+        """
+        Get the handlers' fields affected by any of the changed fields.
+
+        A handler's field is affected if it is either a parent of a changed field
+        (a.b -vs- a.b.c), or a child of it (a.b.c -vs- a.b), or the same field.
+
+        Instead of comparing every changed field with every handler's field,
+        the handlers' fields are indexed by all of their prefixes (cached until
+        new handlers are added). Then, each changed field is looked up once
+        by itself (for the children), and once per its own prefix (for parents).
+        """
+        if self._fields_by_prefix is None:
+            index: Dict[dicts.FieldPath, Set[dicts.FieldPath]] = {}
+            for handler in self._handlers:
+                if handler.field:
+                    for length in range(len(handler.field) + 1):
+                        index.setdefault(handler.field[:length], set()).add(handler.field)
+            self._fields_by_prefix = {prefix: frozenset(fields) for prefix, fields in index.items()}
+
+        fields_by_prefix = self._fields_by_prefix
+        relevant_fields: Set[dicts.FieldPath] = set()
+        for changed_field in changed_fields:
+            relevant_fields.update(fields_by_prefix.get(changed_field, _EMPTY_FIELDS))
+            for length in range(len(changed_field)):
+                prefix = changed_field[:length]
+                if prefix not in fields_by_prefix:
+                    break  # no handlers' fields go deeper than this.
+                if prefix in fields_by_prefix[prefix]:
+                    relevant_fields.add(prefix)
+        return relevant_fields
+
 
 class OperatorRegistry:
     """
@@ -304,6 +435,20 @@ class OperatorRegistry:
                 frozenset(self.resource_spawning_handlers) |
                 frozenset(self.resource_changing_handlers))
 
+    def get_resource_registries(
+            self,
+            resource: resources_.Resource,
+    ) -> Tuple[ResourceWatchingRegistry, ResourceSpawningRegistry, ResourceChangingRegistry]:
+        """
+        Get the watching, spawning, and changing registries of a resource at once.
+
+        Used on every event of the resource: the registries are looked up once
+        per event and then passed to all the event's causes' processing.
+        """
+        return (self.resource_watching_handlers[resource],
+                self.resource_spawning_handlers[resource],
+                self.resource_changing_handlers[resource])
+
     #
     # Everything below is deprecated and will be removed in the next major release.
     #
@@ -514,11 +659,7 @@ class SmartOperatorRegistry(OperatorRegistry):
     def __init__(self) -> None:
         super().__init__()
 
-        try:
-            import pykube
-        except ImportError:
-            pass
-        else:
+        if _HAS_PYKUBE:
             self.activity_handlers.append(handlers.ActivityHandler(
                 id=handlers.HandlerId('login_via_pykube'),
                 fn=cast(callbacks.ActivityFn, piggybacking.login_via_pykube),
@@ -527,11 +668,7 @@ class SmartOperatorRegistry(OperatorRegistry):
                 timeout=None, retries=None, backoff=None, cooldown=None,
                 _fallback=True,
             ))
-        try:
-            import kubernetes
-        except ImportError:
-            pass
-        else:
+        if _HAS_KUBERNETES:
             self.activity_handlers.append(handlers.ActivityHandler(
                 id=handlers.HandlerId('login_via_client'),
                 fn=cast(callbacks.ActivityFn, piggybacking.login_via_client),
@@ -552,17 +689,30 @@ def generate_id(
     real_id = id if id is not None else get_callable_id(fn)
     real_id = real_id if not suffix else f'{real_id}/{suffix}'
     real_id = real_id if not prefix else f'{prefix}/{real_id}'
+    real_id = sys.intern(real_id)  # for faster lookups in the sets/dicts of ids on every cause.
     return cast(handlers.HandlerId, real_id)
 
 
 def get_callable_id(c: Callable[..., Any]) -> str:
     """ Get an reasonably good id of any commonly used callable. """
+
+    # Unwrap the partials & decorated functions in a loop: the wrapping can be deep.
+    # Remember the seen callables to detect the cycles, as `inspect.unwrap` does.
+    seen = {id(c)}
+    while True:
+        if isinstance(c, functools.partial):
+            c = c.func
+        elif hasattr(c, '__wrapped__'):  # @functools.wraps()
+            c = getattr(c, '__wrapped__')
+        else:
+            break
+
+        if id(c) in seen:
+            raise ValueError(f"Cannot get id of {c!r}: its wrapping chain is cyclic.")
+        seen.add(id(c))
+
     if c is None:
         raise ValueError("Cannot build a persistent id of None.")
-    elif isinstance(c, functools.partial):
-        return get_callable_id(c.func)
-    elif hasattr(c, '__wrapped__'):  # @functools.wraps()
-        return get_callable_id(getattr(c, '__wrapped__'))
     elif isinstance(c, FunctionType) and c.__name__ == '<lambda>':
         # The best we can do to keep the id stable across the process restarts,
         # assuming at least no code changes. The code changes are not detectable.
@@ -607,20 +757,42 @@ def _deduplicated(
             yield handler
 
 
+def _as_set(
+        ids: AbstractSet[handlers.HandlerId],
+) -> AbstractSet[handlers.HandlerId]:
+    """ Ensure the hash-based lookups even if other collections are passed. """
+    return ids if isinstance(ids, (set, frozenset)) else frozenset(ids)
+
+
 def match(
         handler: handlers.ResourceHandler,
         cause: causation.ResourceCause,
         changed_fields: Collection[dicts.FieldPath] = frozenset(),
         ignore_fields: bool = False,
+        labels: Optional[Mapping[str, str]] = None,  # if pre-fetched from the cause's body
+        annotations: Optional[Mapping[str, str]] = None,  # if pre-fetched from the cause's body
+        kwargs: Optional[MutableMapping[str, Any]] = None,  # if shared by all handlers of the cause
 ) -> bool:
+    if labels is None or annotations is None:
+        labels, annotations = _get_labels_and_annotations(cause)
+
     # Kwargs are lazily evaluated on the first _actual_ use, and shared for all filters since then.
-    kwargs: MutableMapping[str, Any] = {}
-    return all([
-        _matches_field(handler, changed_fields or {}, ignore_fields),
-        _matches_labels(handler, cause, kwargs),
-        _matches_annotations(handler, cause, kwargs),
-        _matches_filter_callback(handler, cause, kwargs),
-    ])
+    # The filters are short-circuited from the cheapest ones to the user-defined callbacks.
+    if kwargs is None:
+        kwargs = {}
+    return (
+        _matches_field(handler, changed_fields or _EMPTY_FIELDS, ignore_fields) and
+        _matches_labels(handler, labels, cause, kwargs) and
+        _matches_annotations(handler, annotations, cause, kwargs) and
+        _matches_filter_callback(handler, cause, kwargs)
+    )
+
+
+def _get_labels_and_annotations(
+        cause: causation.ResourceCause,
+) -> Tuple[Mapping[str, str], Mapping[str, str]]:
+    metadata = cause.body.get('metadata', _EMPTY_MAPPING)
+    return metadata.get('labels', _EMPTY_MAPPING), metadata.get('annotations', _EMPTY_MAPPING)
 
 
 def _matches_field(
@@ -638,53 +810,53 @@ def _matches_field(
 
 def _matches_labels(
         handler: handlers.ResourceHandler,
+        labels: Mapping[str, str],
         cause: causation.ResourceCause,
         kwargs: MutableMapping[str, Any],
 ) -> bool:
-    return (not handler.labels or
-            _matches_metadata(pattern=handler.labels,
-                              content=cause.body.get('metadata', {}).get('labels', {}),
-                              kwargs=kwargs, cause=cause))
+    if not handler.labels:
+        return True
+    if handler._labels_filter is None:
+        handler._labels_filter = filters.CompiledMetaFilter.from_pattern(handler.labels)
+    return _matches_metadata(pattern=handler._labels_filter,
+                             content=labels,
+                             kwargs=kwargs, cause=cause)
 
 
 def _matches_annotations(
         handler: handlers.ResourceHandler,
+        annotations: Mapping[str, str],
         cause: causation.ResourceCause,
         kwargs: MutableMapping[str, Any],
 ) -> bool:
-    return (not handler.annotations or
-            _matches_metadata(pattern=handler.annotations,
-                              content=cause.body.get('metadata', {}).get('annotations', {}),
-                              kwargs=kwargs, cause=cause))
+    if not handler.annotations:
+        return True
+    if handler._annotations_filter is None:
+        handler._annotations_filter = filters.CompiledMetaFilter.from_pattern(handler.annotations)
+    return _matches_metadata(pattern=handler._annotations_filter,
+                             content=annotations,
+                             kwargs=kwargs, cause=cause)
 
 
 def _matches_metadata(
         *,
-        pattern: filters.MetaFilter,  # from the handler
+        pattern: filters.CompiledMetaFilter,  # from the handler
         content: Mapping[str, str],  # from the body
         kwargs: MutableMapping[str, Any],
         cause: causation.ResourceCause,
 ) -> bool:
-    for key, value in pattern.items():
-        if value is filters.MetaFilterToken.ABSENT and key not in content:
-            continue
-        elif value is filters.MetaFilterToken.PRESENT and key in content:
-            continue
-        elif value is None and key in content:  # deprecated; warned in @kopf.on
-            continue
-        elif callable(value):
-            if not kwargs:
-                kwargs.update(invocation.build_kwargs(cause=cause))
-            if value(content.get(key, None), **kwargs):
-                continue
-            else:
-                return False
-        elif key not in content:
-            return False
-        elif value != content[key]:
+    # Iterate over the filter's few keys, not over the object's many labels/annotations.
+    if pattern.absent_keys and any(key in content for key in pattern.absent_keys):
+        return False
+    if not content.keys() >= pattern.present_keys:
+        return False
+    if not content.items() >= pattern.exact_items:
+        return False
+    for key, callback in pattern.callback_values:
+        if not kwargs:
+            kwargs.update(invocation.build_kwargs(cause=cause))
+        if not callback(content.get(key, None), **kwargs):
             return False
-        else:
-            continue
     return True
 
 
@@ -700,19 +872,11 @@ def _matches_filter_callback(
     return handler.when(**kwargs)
 
 
-_default_registry: Optional[OperatorRegistry] = None
-
-
 def get_default_registry() -> OperatorRegistry:
     """
     Get the default registry to be used by the decorators and the reactor
     unless the explicit registry is provided to them.
     """
-    global _default_registry
-    if _default_registry is None:
-        # TODO: Deprecated registry to ensure backward-compatibility until removal:
-        from kopf.toolkits.legacy_registries import SmartGlobalRegistry
-        _default_registry = SmartGlobalRegistry()
     return _default_registry
 
 
@@ -723,3 +887,11 @@ def set_default_registry(registry: OperatorRegistry) -> None:
     """
     global _default_registry
     _default_registry = registry
+
+
+# The default registry is created at import time, so that no threads can race to create it.
+# TODO: Deprecated registry to ensure backward-compatibility until removal.
+# It is imported here, at the end, since the legacy registries are based on the classes above.
+from kopf.toolkits import legacy_registries  # noqa  # cyclic imports
+
+_default_registry: OperatorRegistry = legacy_registries.SmartGlobalRegistry()
@@ -61,6 +61,14 @@ class PostingSettings:
     (``kopf.info()``, ``kopf.warn()``, ``kopf.exception()``).
     """
 
+    queue_size: int = 1024
+    """
+    How many k8s-events can be queued for posting at most (``0`` is unlimited).
+
+    When the queue is full (e.g. when the API is slow), the new k8s-events
+    are dropped with a warning in the logs instead of blocking the handlers.
+    """
+
 
 @dataclasses.dataclass
 class WatchingSettings:
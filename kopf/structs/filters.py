@@ -1,5 +1,6 @@
+import dataclasses
 import enum
-from typing import Mapping, Union
+from typing import Any, FrozenSet, Mapping, Tuple, Union
 
 from kopf.structs import callbacks
 
@@ -16,3 +17,39 @@ PRESENT = MetaFilterToken.PRESENT
 
 # Filters for handler specifications (not the same as the object's values).
 MetaFilter = Mapping[str, Union[None, str, MetaFilterToken, callbacks.MetaFilterFn]]
+
+
+@dataclasses.dataclass(frozen=True)
+class CompiledMetaFilter:
+    """
+    A metadata filter pre-split by the kinds of its criteria.
+
+    The filter is interpreted once when the handler is created, not on every
+    event: the keys' presence/absence is checked with sets, the exact values
+    as a set of key-value pairs (so that the whole check is done in C by
+    the dict's items view), and the callbacks (the costliest ones) go last.
+    """
+    absent_keys: FrozenSet[str]
+    present_keys: FrozenSet[str]
+    exact_items: FrozenSet[Tuple[str, Any]]
+    callback_values: Tuple[Tuple[str, callbacks.MetaFilterFn], ...]
+
+    @classmethod
+    def from_pattern(cls, pattern: MetaFilter) -> "CompiledMetaFilter":
+        absent_keys = set()
+        present_keys = set()
+        exact_values = []
+        callback_values = []
+        for key, value in pattern.items():
+            if value is MetaFilterToken.ABSENT:
+                absent_keys.add(key)
+            elif value is MetaFilterToken.PRESENT or value is None:  # None is deprecated.
+                present_keys.add(key)
+            elif callable(value):
+                callback_values.append((key, value))
+            else:
+                exact_values.append((key, value))
+        return cls(absent_keys=frozenset(absent_keys),
+                   present_keys=frozenset(present_keys),
+                   exact_items=frozenset(exact_values),
+                   callback_values=tuple(callback_values))
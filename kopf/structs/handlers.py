@@ -87,12 +87,14 @@ class BaseHandler:
             self.backoff = cooldown
 
     # @property cannot be used due to a data field definition with the same name.
-    def __getattribute__(self, name: str) -> Any:
+    # __getattr__ is called only when the regular lookup fails, i.e. never for the real fields,
+    # so the frequent reads of the handlers' fields in the registries are not slowed down.
+    def __getattr__(self, name: str) -> Any:
         if name == 'cooldown':
             warnings.warn("handler.cooldown is deprecated, use handler.backoff", DeprecationWarning)
             return self.backoff
         else:
-            return super().__getattribute__(name)
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
 
     # Used in the logs. Overridden in some (but not all) handler types for better log messages.
     def __str__(self) -> str:
@@ -115,6 +117,12 @@ class ResourceHandler(BaseHandler):
     annotations: Optional[filters.MetaFilter]
     when: Optional[callbacks.WhenFilterFn]
 
+    # Non-public: the filters are interpreted once on the first use, not on every event.
+    _labels_filter: Optional[filters.CompiledMetaFilter] = dataclasses.field(
+        init=False, repr=False, compare=False, default=None)
+    _annotations_filter: Optional[filters.CompiledMetaFilter] = dataclasses.field(
+        init=False, repr=False, compare=False, default=None)
+
 
 @dataclasses.dataclass
 class ResourceWatchingHandler(ResourceHandler):
@@ -169,7 +169,7 @@ class SimpleRegistry(BaseRegistry, registries.ResourceRegistry[
         warnings.warn("SimpleRegistry.iter_cause_handlers() is deprecated; use "
                       "ResourceChangingRegistry.iter_handlers().", DeprecationWarning)
 
-        changed_fields = frozenset(field for _, field, _, _ in cause.diff or [])
+        changed_fields = frozenset(field for _, field, _, _ in cause.diff or ())
         for handler in self._handlers:
             if not isinstance(handler, handlers.ResourceChangingHandler):
                 pass
@@ -49,4 +49,8 @@ setup(
         'aiojobs',
         'pykube-ng>=0.27',  # used only for config parsing
     ],
+    extras_require={
+        'uvloop': ['uvloop'],  # a faster event loop, used if installed
+        'orjson': ['orjson'],  # a faster JSON serializer, used if installed
+    },
 )
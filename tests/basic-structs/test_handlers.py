@@ -88,3 +88,19 @@ def test_resource_handler_with_all_args(mocker):
 
     with pytest.deprecated_call(match=r"use handler.backoff"):
         assert handler.cooldown is backoff
+
+
+def test_handler_with_unknown_attribute(mocker):
+    handler = ActivityHandler(
+        fn=mocker.Mock(),
+        id=mocker.Mock(),
+        errors=None,
+        timeout=None,
+        retries=None,
+        backoff=None,
+        cooldown=None,
+        activity=None,
+    )
+
+    with pytest.raises(AttributeError, match=r"no attribute 'unknown'"):
+        handler.unknown
@@ -1,3 +1,4 @@
+import asyncio
 import functools
 import sys
 
@@ -51,6 +52,22 @@ def clean_modules_cache():
             del sys.modules[key]
 
 
+@pytest.fixture(autouse=True)
+def event_loop_restored():
+    # The CLI commands can replace & close the main thread's event loop (e.g. with uvloop's).
+    # Give them a disposable loop instead of the tests' one, and close whatever remains after.
+    policy = asyncio.get_event_loop_policy()
+    loop = asyncio.get_event_loop()
+    asyncio.set_event_loop(asyncio.new_event_loop())
+    try:
+        yield
+    finally:
+        cli_loop = asyncio.get_event_loop()
+        asyncio.set_event_loop_policy(policy)
+        asyncio.set_event_loop(loop)
+        cli_loop.close()
+
+
 @pytest.fixture()
 def runner():
     runner = click.testing.CliRunner()
@@ -0,0 +1,91 @@
+import asyncio
+import sys
+import threading
+
+import pytest
+
+
+@pytest.fixture()
+def uvloop(mocker):
+    module = mocker.Mock()
+    mocker.patch.dict(sys.modules, uvloop=module)
+    return module
+
+
+@pytest.fixture()
+def no_uvloop(mocker):
+    mocker.patch.dict(sys.modules, uvloop=None)
+
+
+def test_uvloop_used_when_available(invoke, preload, real_run):
+    uvloop = pytest.importorskip('uvloop')
+    result = invoke(['run'])
+    assert result.exit_code == 0
+    assert real_run.called
+    assert isinstance(asyncio.get_event_loop(), uvloop.Loop)
+
+
+def test_uvloop_does_not_change_the_policy(invoke, preload, real_run):
+    pytest.importorskip('uvloop')
+    policy = asyncio.get_event_loop_policy()
+    result = invoke(['run'])
+    assert result.exit_code == 0
+    assert asyncio.get_event_loop_policy() is policy
+
+
+@pytest.mark.parametrize('command, expected, unexpected', [
+    (['freeze', '--lifetime=1', '--peering=peering'], 'keepalive', 'disappear'),
+    (['resume', '--peering=peering'], 'disappear', 'keepalive'),
+])
+def test_uvloop_runs_the_commands(invoke, mocker, command, expected, unexpected):
+    uvloop = pytest.importorskip('uvloop')
+    expected_mock = mocker.patch(f'kopf.engines.peering.Peer.{expected}')
+    unexpected_mock = mocker.patch(f'kopf.engines.peering.Peer.{unexpected}')
+    result = invoke(command)
+    assert result.exit_code == 0
+    assert expected_mock.await_count == 1
+    assert not unexpected_mock.called
+    assert isinstance(asyncio.get_event_loop(), uvloop.Loop)
+
+
+def test_uvloop_closes_the_previous_loop(invoke, preload, real_run):
+    pytest.importorskip('uvloop')
+    previous_loop = asyncio.get_event_loop()
+    result = invoke(['run'])
+    assert result.exit_code == 0
+    assert previous_loop.is_closed()
+
+
+def test_uvloop_reuses_its_own_loop(invoke, preload, real_run):
+    pytest.importorskip('uvloop')
+    invoke(['run'])
+    uvloop_loop = asyncio.get_event_loop()
+    result = invoke(['run'])
+    assert result.exit_code == 0
+    assert asyncio.get_event_loop() is uvloop_loop
+    assert not uvloop_loop.is_closed()
+
+
+@pytest.mark.usefixtures('no_uvloop')
+def test_stdlib_asyncio_when_uvloop_is_absent(invoke, preload, real_run):
+    result = invoke(['run'])
+    assert result.exit_code == 0
+    assert real_run.called
+
+
+def test_uvloop_not_installed_in_threads(invoke, uvloop, preload, real_run):
+    results = []
+
+    def target():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        try:
+            results.append(invoke(['run']))
+        finally:
+            loop.close()
+
+    thread = threading.Thread(target=target)
+    thread.start()
+    thread.join()
+    assert results[0].exit_code == 0
+    assert not uvloop.new_event_loop.called
@@ -1,4 +1,7 @@
+import json
+
 import aiohttp.web
+import freezegun
 import pytest
 
 from kopf.structs.bodies import build_object_reference
@@ -35,6 +38,67 @@ async def test_posting(
     assert data['involvedObject']['namespace'] == 'ns'
     assert data['involvedObject']['name'] == 'name'
     assert data['involvedObject']['uid'] == 'uid'
+    assert data['count'] == 1
+
+
+async def test_aggregated_count(
+        resp_mocker, aresponses, hostname):
+
+    post_mock = resp_mocker(return_value=aiohttp.web.json_response({}))
+    aresponses.add(hostname, EVENTS_CORE_V1_CRD.get_url(namespace='ns'), 'post', post_mock)
+
+    obj = {'apiVersion': 'group/version',
+           'kind': 'kind',
+           'metadata': {'namespace': 'ns',
+                        'name': 'name',
+                        'uid': 'uid'}}
+    ref = build_object_reference(obj)
+    await post_event(ref=ref, type='type', reason='reason', message='message', count=5)
+
+    data = post_mock.call_args_list[0][0][0].data  # [callidx][args/kwargs][argidx]
+    assert data['count'] == 5
+
+
+async def test_orjson_is_used_if_installed(
+        resp_mocker, aresponses, hostname, mocker):
+
+    orjson = mocker.patch('kopf.clients.events.orjson')
+    orjson.dumps.side_effect = lambda obj: json.dumps(obj).encode('utf-8')
+    post_mock = resp_mocker(return_value=aiohttp.web.json_response({}))
+    aresponses.add(hostname, EVENTS_CORE_V1_CRD.get_url(namespace='ns'), 'post', post_mock)
+
+    obj = {'apiVersion': 'group/version',
+           'kind': 'kind',
+           'metadata': {'namespace': 'ns',
+                        'name': 'name',
+                        'uid': 'uid'}}
+    ref = build_object_reference(obj)
+    await post_event(ref=ref, type='type', reason='reason', message='message')
+
+    assert orjson.dumps.call_count == 1
+    data = post_mock.call_args_list[0][0][0].data  # [callidx][args/kwargs][argidx]
+    assert data['type'] == 'type'
+
+
+@freezegun.freeze_time('2020-12-31T23:59:59.123456')
+async def test_timestamps(
+        resp_mocker, aresponses, hostname):
+
+    post_mock = resp_mocker(return_value=aiohttp.web.json_response({}))
+    aresponses.add(hostname, EVENTS_CORE_V1_CRD.get_url(namespace='ns'), 'post', post_mock)
+
+    obj = {'apiVersion': 'group/version',
+           'kind': 'kind',
+           'metadata': {'namespace': 'ns',
+                        'name': 'name',
+                        'uid': 'uid'}}
+    ref = build_object_reference(obj)
+    await post_event(ref=ref, type='type', reason='reason', message='message')
+
+    data = post_mock.call_args_list[0][0][0].data  # [callidx][args/kwargs][argidx]
+    assert data['firstTimestamp'] == '2020-12-31T23:59:59.123456Z'
+    assert data['lastTimestamp'] == '2020-12-31T23:59:59.123456Z'
+    assert data['eventTime'] == '2020-12-31T23:59:59.123456Z'
 
 
 async def test_type_is_v1_not_v1beta1(
@@ -10,6 +10,11 @@ REF1 = {'apiVersion': 'group1/version1', 'kind': 'Kind1',
         'uid': 'uid1', 'name': 'name1', 'namespace': 'ns1'}
 
 
+@pytest.fixture(autouse=True)
+def _settings_via_contextvar(settings_via_contextvar):
+    pass
+
+
 @pytest.mark.parametrize('logfn, event_type', [
     ['info', "Normal"],
     ['warning', "Warning"],
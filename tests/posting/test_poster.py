@@ -48,6 +48,33 @@ async def test_poster_polls_and_posts(mocker):
     )
 
 
+async def test_poster_aggregates_identical_queued_events(mocker):
+    event1 = K8sEvent(type='type1', reason='reason1', message='message1', ref=REF1)
+    event2 = K8sEvent(type='type2', reason='reason2', message='message2', ref=REF2)
+    event_queue = asyncio.Queue()
+    event_queue.put_nowait(event1)
+    event_queue.put_nowait(event2)
+    event_queue.put_nowait(event1)
+    event_queue.put_nowait(event1)
+
+    # A way to cancel `while True` cycle when we need it (ASAP).
+    def _cancel(*args, **kwargs):
+        if post_event.call_count >= 2:
+            raise asyncio.CancelledError()
+    post_event = mocker.patch('kopf.clients.events.post_event', side_effect=_cancel)
+
+    # A way to cancel `whole True` cycle by timing, event if routines are not called.
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(
+            poster(event_queue=event_queue), timeout=0.5)
+
+    assert post_event.call_count == 2
+    assert post_event.call_args_list == [
+        call(ref=REF1, type='type1', reason='reason1', message='message1', count=3),
+        call(ref=REF2, type='type2', reason='reason2', message='message2', count=1),
+    ]
+
+
 def test_queueing_fails_with_no_queue(event_queue_loop):
     # Prerequisite: the context-var should not be set by anything in advance.
     sentinel = object()
@@ -105,3 +132,30 @@ async def test_via_shortcut(settings, mocker, event_fn, event_type, min_levelno,
     assert event1.type == event_type
     assert event1.reason == 'reason1'
     assert event1.message == 'message1'
+
+
+async def test_queueing_drops_events_when_full(settings, mocker, assert_logs,
+                                               event_queue, event_queue_loop):
+    post_event = mocker.patch('kopf.clients.events.post_event')
+
+    settings.posting.queue_size = 1
+    event(OBJ1, type='type1', reason='reason1', message='message1')  # queued
+    event(OBJ1, type='type2', reason='reason2', message='message2')  # dropped
+
+    assert not post_event.called
+    assert event_queue.qsize() == 1
+    assert event_queue.get_nowait().reason == 'reason1'
+    assert_logs([
+        "K8s-event is dropped: the posting queue is full.*'reason2'",
+    ])
+
+
+async def test_queueing_is_unlimited_with_zero_size(settings, mocker, event_queue, event_queue_loop):
+    post_event = mocker.patch('kopf.clients.events.post_event')
+
+    settings.posting.queue_size = 0
+    for _ in range(3):
+        event(OBJ1, type='type1', reason='reason1', message='message1')
+
+    assert not post_event.called
+    assert event_queue.qsize() == 3
@@ -123,6 +123,24 @@ def test_catchall_handlers_with_field_ignored(
     assert not handlers
 
 
+@pytest.mark.parametrize('field, changed_field, expected', [
+    pytest.param('spec.a.b', ('spec', 'a', 'b'), True, id='same'),
+    pytest.param('spec.a', ('spec', 'a', 'b'), True, id='parent'),
+    pytest.param('spec.a.b', ('spec', 'a'), True, id='child'),
+    pytest.param('spec.a.b', (), True, id='root'),
+    pytest.param('spec.a.b', ('spec', 'a', 'c'), False, id='sibling'),
+    pytest.param('spec.a', ('spec', 'ab'), False, id='similar-name'),
+    pytest.param('spec.a', ('status', 'a'), False, id='other-root'),
+])
+def test_catchall_handlers_with_related_fields(
+        registry, handler_factory, resource, field, changed_field, expected):
+    cause = Mock(resource=resource, reason='some-reason', body={},
+                 diff=[('op', changed_field, 'old', 'new')])
+    handler_factory(reason=None, field=parse_field(field))
+    handlers = registry.resource_changing_handlers[cause.resource].get_handlers(cause)
+    assert bool(handlers) == expected
+
+
 @pytest.mark.parametrize('labels', [
     pytest.param({'somelabel': 'somevalue'}, id='with-label'),
     pytest.param({'somelabel': 'somevalue', 'otherlabel': 'othervalue'}, id='with-extra-label'),
@@ -222,6 +240,20 @@ def test_catchall_handlers_with_labels_callback_says_false(
     assert not handlers
 
 
+@pytest.mark.parametrize('labels', [
+    pytest.param({}, id='without-label'),
+    pytest.param({'somelabel': 'othervalue'}, id='with-other-value'),
+])
+def test_catchall_handlers_with_labels_callback_not_called_if_values_mismatch(
+        registry, handler_factory, resource, labels):
+    cause = Mock(resource=resource, reason='some-reason', diff=None, body={'metadata': {'labels': labels}})
+    callback = Mock(return_value=True)
+    handler_factory(reason=None, labels={'otherlabel': callback, 'somelabel': 'somevalue'})
+    handlers = registry.resource_changing_handlers[cause.resource].get_handlers(cause)
+    assert not handlers
+    assert not callback.called
+
+
 @pytest.mark.parametrize('labels', [
     pytest.param({}, id='without-label'),
     pytest.param({'somelabel': 'somevalue'}, id='with-label'),
@@ -424,6 +456,36 @@ def test_catchall_handlers_with_when_callback_mismatching(
     assert not handlers
 
 
+def test_catchall_handlers_with_when_callbacks_share_kwargs(
+        mocker, registry, handler_factory, resource):
+    cause = ResourceChangingCause(
+        resource=resource,
+        reason='some-reason',
+        diff=None,
+        body=Body({'spec': {'name': 'test'}}),
+        logger=None,
+        patch=None,
+        memo=None,
+        initial=None
+    )
+    build_kwargs = mocker.spy(kopf.reactor.invocation, 'build_kwargs')
+    handler_factory(reason=None, when=_always, id='a', fn=_never)
+    handler_factory(reason=None, when=_always, id='b', fn=_always)
+    handlers = registry.resource_changing_handlers[cause.resource].get_handlers(cause)
+    assert len(handlers) == 2
+    assert build_kwargs.call_count == 1
+
+
+def test_catchall_handlers_with_when_callback_not_called_if_labels_mismatch(
+        registry, handler_factory, resource):
+    cause = Mock(resource=resource, reason='some-reason', diff=None, body={'metadata': {'labels': {}}})
+    when = Mock(return_value=True)
+    handler_factory(reason=None, labels={'somelabel': 'somevalue'}, when=when)
+    handlers = registry.resource_changing_handlers[cause.resource].get_handlers(cause)
+    assert not handlers
+    assert not when.called
+
+
 #
 # Relevant handlers are those with reason matching the cause's reason.
 # In the per-field handlers, also with field == 'some-field' (not 'another-field').
@@ -775,6 +837,26 @@ def test_order_persisted_b(cause_with_diff, registry, resource):
     assert handlers[1].fn is some_fn_3
     assert handlers[2].fn is some_fn_5
 
+
+def test_handlers_added_after_the_first_use(cause_with_diff, registry, resource):
+
+    @kopf.on.create(resource.group, resource.version, resource.plural, registry=registry)
+    def some_fn_1(**_): ...  # used
+
+    cause = cause_with_diff
+    cause.reason = Reason.CREATE
+    handlers = registry.resource_changing_handlers[cause.resource].get_handlers(cause)
+    assert len(handlers) == 1
+
+    @kopf.on.create(resource.group, resource.version, resource.plural, registry=registry)
+    def some_fn_2(**_): ...  # used
+
+    handlers = registry.resource_changing_handlers[cause.resource].get_handlers(cause)
+    assert len(handlers) == 2
+    assert handlers[0].fn is some_fn_1
+    assert handlers[1].fn is some_fn_2
+
+
 #
 # Same function should not be returned twice for the same event/cause.
 # Only actual for the cases when the event/cause can match multiple handlers.
@@ -1,5 +1,7 @@
 import functools
 
+import pytest
+
 from kopf.reactor.registries import get_callable_id
 
 
@@ -52,6 +54,33 @@ def test_id_of_double_wrapper():
     assert fn_id == 'some_fn'
 
 
+def test_id_of_partials_and_wrappers_mixed_deeply():
+    fn = some_fn
+    for _ in range(2000):  # deeper than the default recursion limit
+        fn = functools.wraps(fn)(functools.partial(fn))
+
+    fn_id = get_callable_id(fn)
+    assert fn_id == 'some_fn'
+
+
+def test_id_of_self_wrapped_function():
+    def fn(): pass
+    fn.__wrapped__ = fn
+
+    with pytest.raises(ValueError, match=r"cyclic"):
+        get_callable_id(fn)
+
+
+def test_id_of_cyclically_wrapped_functions():
+    def fn1(): pass
+    def fn2(): pass
+    fn1.__wrapped__ = fn2
+    fn2.__wrapped__ = functools.partial(fn1)
+
+    with pytest.raises(ValueError, match=r"cyclic"):
+        get_callable_id(fn1)
+
+
 def test_id_of_lambda():
     some_lambda = lambda: None
 
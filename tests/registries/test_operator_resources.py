@@ -1,7 +1,9 @@
 import collections
 from unittest.mock import Mock
 
-from kopf.reactor.registries import OperatorRegistry
+import pytest
+
+from kopf.reactor.registries import OperatorRegistry, ResourceChangingRegistry
 from kopf.structs.resources import Resource
 
 
@@ -24,3 +26,96 @@ def test_resources():
 
     assert resource1 in resources
     assert resource2 in resources
+
+
+def test_resources_added_after_the_first_use():
+    handler = Mock()
+
+    resource1 = Resource('group1', 'version1', 'plural1')
+    resource2 = Resource('group2', 'version2', 'plural2')
+    resource3 = Resource('group3', 'version3', 'plural3')
+
+    registry = OperatorRegistry()
+    registry.resource_watching_handlers[resource1].append(handler)
+    assert registry.resources == {resource1}
+
+    registry.resource_spawning_handlers[resource2].append(handler)
+    assert registry.resources == {resource1, resource2}
+
+    registry.resource_changing_handlers[resource3].append(handler)
+    assert registry.resources == {resource1, resource2, resource3}
+
+
+@pytest.mark.parametrize('mutate', [
+    pytest.param(lambda registries, resource: registries.pop(resource), id='pop'),
+    pytest.param(lambda registries, resource: registries.popitem(), id='popitem'),
+    pytest.param(lambda registries, resource: registries.clear(), id='clear'),
+])
+def test_resources_removed_after_the_first_use(mutate):
+    resource = Resource('group1', 'version1', 'plural1')
+
+    registry = OperatorRegistry()
+    registry.resource_watching_handlers[resource].append(Mock())
+    assert registry.resources == {resource}
+
+    mutate(registry.resource_watching_handlers, resource)
+    assert registry.resources == set()
+
+
+@pytest.mark.parametrize('mutate', [
+    pytest.param(lambda registries, resource: registries.setdefault(resource, Mock()), id='setdefault'),
+    pytest.param(lambda registries, resource: registries.update({resource: Mock()}), id='update'),
+])
+def test_resources_inserted_after_the_first_use(mutate):
+    resource = Resource('group1', 'version1', 'plural1')
+
+    registry = OperatorRegistry()
+    assert registry.resources == set()
+
+    mutate(registry.resource_watching_handlers, resource)
+    assert registry.resources == {resource}
+
+
+def test_resource_registries():
+    resource1 = Resource('group1', 'version1', 'plural1')
+    resource2 = Resource('group2', 'version2', 'plural2')
+
+    registry = OperatorRegistry()
+    registries1 = registry.get_resource_registries(resource1)
+    registries2 = registry.get_resource_registries(resource2)
+
+    assert registries1 == (registry.resource_watching_handlers[resource1],
+                           registry.resource_spawning_handlers[resource1],
+                           registry.resource_changing_handlers[resource1])
+    assert registries2 == (registry.resource_watching_handlers[resource2],
+                           registry.resource_spawning_handlers[resource2],
+                           registry.resource_changing_handlers[resource2])
+    assert registry.get_resource_registries(resource1) == registries1
+
+
+def test_resource_registries_replaced_after_the_first_use():
+    resource = Resource('group1', 'version1', 'plural1')
+
+    registry = OperatorRegistry()
+    registry.get_resource_registries(resource)
+    del registry.resource_changing_handlers[resource]
+    _, _, changing_registry = registry.get_resource_registries(resource)
+
+    assert changing_registry is registry.resource_changing_handlers[resource]
+
+
+@pytest.mark.parametrize('replace', [
+    pytest.param(lambda registries, resource, new: registries.update({resource: new}), id='update'),
+    pytest.param(lambda registries, resource, new: registries.pop(resource), id='pop'),
+    pytest.param(lambda registries, resource, new: registries.clear(), id='clear'),
+])
+def test_resource_registries_mutated_after_the_first_use(replace):
+    resource = Resource('group1', 'version1', 'plural1')
+    new_registry = ResourceChangingRegistry()
+
+    registry = OperatorRegistry()
+    registry.get_resource_registries(resource)
+    replace(registry.resource_changing_handlers, resource, new_registry)
+    _, _, changing_registry = registry.get_resource_registries(resource)
+
+    assert changing_registry is registry.resource_changing_handlers[resource]
@@ -166,3 +166,24 @@ def test_requires_finalizer_deletion_handler_mismatches_annotations(annotations,
 
     requires_finalizer = registry.resource_changing_handlers[resource].requires_finalizer(CAUSE)
     assert requires_finalizer == expected
+
+
+def test_requires_finalizer_deletion_handler_added_after_the_first_use():
+    registry = OperatorRegistry()
+    resource = Resource('group', 'version', 'plural')
+
+    @kopf.on.create('group', 'version', 'plural',
+                    registry=registry)
+    def fn1(**_):
+        pass
+
+    requires_finalizer = registry.resource_changing_handlers[resource].requires_finalizer(CAUSE)
+    assert requires_finalizer == False
+
+    @kopf.on.delete('group', 'version', 'plural',
+                    registry=registry)
+    def fn2(**_):
+        pass
+
+    requires_finalizer = registry.resource_changing_handlers[resource].requires_finalizer(CAUSE)
+    assert requires_finalizer == True
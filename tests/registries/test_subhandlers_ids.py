@@ -1,3 +1,5 @@
+import sys
+
 import kopf
 from kopf.reactor.handling import handler_var
 from kopf.reactor.invocation import context
@@ -34,3 +36,15 @@ def test_with_parent(
     assert len(handlers) == 1
     assert handlers[0].fn is child_fn
     assert handlers[0].id == 'parent_fn/child_fn'
+
+
+def test_ids_are_interned(
+        mocker, parent_handler, resource_registry_cls):
+
+    registry = resource_registry_cls()
+
+    with context([(handler_var, parent_handler)]):
+        kopf.on.this(registry=registry)(child_fn)
+
+    handlers = registry.get_handlers(mocker.MagicMock())
+    assert handlers[0].id is sys.intern(''.join(['parent_fn/', 'child_fn']))
@@ -6,6 +6,7 @@ import kopf
 async def test_declared_public_interface_and_promised_defaults():
     settings = kopf.OperatorSettings()
     assert settings.posting.level == logging.INFO
+    assert settings.posting.queue_size == 1024
     assert settings.watching.reconnect_backoff == 0.1
     assert settings.watching.connect_timeout is None
     assert settings.watching.server_timeout is None